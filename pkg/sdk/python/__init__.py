@@ -9,6 +9,8 @@ from .module import (
     Response, 
     Event, 
     HealthStatus, 
+    encode_error_response,
+    error_response,
     run_module
 )
 from .logger import create_logger, Logger, LogLevel
@@ -22,6 +24,8 @@ __all__ = [
     'Response',
     'Event',
     'HealthStatus',
+    'encode_error_response',
+    'error_response',
     'run_module',
     'create_logger',
     'Logger',
@@ -0,0 +1,122 @@
+# cython: language_level=3
+# -*- coding: utf-8 -*-
+"""ConfigHelper 扁平读取与路径查找的Cython实现
+
+与 config.py 中的纯Python实现行为一致，构建方式：
+    cythonize -i pkg/sdk/python/_confighelper.pyx
+修改转换逻辑时需同步 config.py，test_config.py 会校验两者结果一致。
+未构建时 config.py 自动使用纯Python实现。
+"""
+
+from cpython.dict cimport PyDict_Check, PyDict_GetItemWithError
+from cpython.object cimport PyObject
+
+cdef inline object _to_int(object value, object default_value):
+    t = type(value)
+    if t is float or t is bool:
+        return int(value)
+    elif t is str:
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    return default_value
+
+cdef inline object _to_float(object value, object default_value):
+    t = type(value)
+    if t is int or t is bool:
+        return float(value)
+    elif t is str:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return default_value
+
+cdef inline object _to_bool(object value, object default_value):
+    t = type(value)
+    if t is str:
+        return value.lower() in ("true", "yes", "1", "on")
+    elif t is int:
+        return value != 0
+    return default_value
+
+cdef class ConfigGetters:
+    """扁平配置的类型化读取，对应 config.py 中的 _ConfigGetters"""
+
+    cdef public object _config
+
+    cdef inline object _get(self, object key):
+        # 缺失与值为None等价，均返回None；不可哈希的键与纯Python实现一样抛出TypeError
+        cdef PyObject* item
+        if not PyDict_Check(self._config):
+            return self._config.get(key)
+        item = PyDict_GetItemWithError(self._config, key)
+        if item is NULL:
+            return None
+        return <object>item
+
+    def get_string(self, key, default_value=""):
+        """获取字符串配置"""
+        value = self._get(key)
+        if type(value) is str:
+            return value
+        return default_value
+
+    def get_int(self, key, default_value=0):
+        """获取整数配置"""
+        value = self._get(key)
+        if type(value) is int:
+            return value
+        if value is None:
+            return default_value
+        return _to_int(value, default_value)
+
+    def get_float(self, key, default_value=0.0):
+        """获取浮点数配置"""
+        value = self._get(key)
+        if type(value) is float:
+            return value
+        if value is None:
+            return default_value
+        return _to_float(value, default_value)
+
+    def get_bool(self, key, default_value=False):
+        """获取布尔值配置"""
+        value = self._get(key)
+        if type(value) is bool:
+            return value
+        if value is None:
+            return default_value
+        return _to_bool(value, default_value)
+
+    def get_list(self, key, default_value=None):
+        """获取列表配置"""
+        if default_value is None:
+            default_value = []
+        value = self._get(key)
+        if isinstance(value, list):
+            return value
+        return default_value
+
+    def get_dict(self, key, default_value=None):
+        """获取字典配置"""
+        if default_value is None:
+            default_value = {}
+        value = self._get(key)
+        if isinstance(value, dict):
+            return value
+        return default_value
+
+cpdef object lookup_path(object config, tuple keys, object default_value):
+    """按路径逐级查找嵌套配置"""
+    cdef PyObject* item
+    cdef object current = config
+    for key in keys:
+        if not PyDict_Check(current):
+            return default_value
+        item = PyDict_GetItemWithError(current, key)
+        if item is NULL:
+            return default_value
+        current = <object>item
+    return current
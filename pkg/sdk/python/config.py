@@ -1,167 +1,248 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from typing import Dict, Any, List, Optional, Union, TypeVar, cast
+import functools
+from typing import Dict, Any, List, Optional, Tuple, Union, TypeVar, cast
 
 T = TypeVar('T')
 
-class ConfigHelper:
-    """配置辅助类"""
-    
-    def __init__(self, config: Dict[str, Any]):
-        """初始化配置辅助类"""
-        self.config = config
-    
+# 缺失值哨兵，用于单次字典查找区分"不存在"和"值为None"
+_MISSING = object()
+
+def _to_int(value: Any, default_value: Any) -> Any:
+    """转换为整数"""
+    t = type(value)
+    if t is int:
+        return value
+    elif t is float or t is bool:
+        return int(value)
+    elif t is str:
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    return default_value
+
+def _to_float(value: Any, default_value: Any) -> Any:
+    """转换为浮点数"""
+    t = type(value)
+    if t is float:
+        return value
+    elif t is int or t is bool:
+        return float(value)
+    elif t is str:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return default_value
+
+def _to_bool(value: Any, default_value: Any) -> Any:
+    """转换为布尔值"""
+    t = type(value)
+    if t is bool:
+        return value
+    elif t is str:
+        return value.lower() in ("true", "yes", "1", "on")
+    elif t is int:
+        return value != 0
+    return default_value
+
+def _to_list(value: Any, default_value: Any) -> Any:
+    """转换为列表"""
+    if isinstance(value, list):
+        return value
+    return default_value
+
+def _to_dict(value: Any, default_value: Any) -> Any:
+    """转换为字典"""
+    if isinstance(value, dict):
+        return value
+    return default_value
+
+def _lookup_path(config: Dict[str, Any], keys: Tuple[str, ...], default_value: Any) -> Any:
+    """按路径逐级查找嵌套配置"""
+    current = config
+
+    for key in keys:
+        if not isinstance(current, dict):
+            return default_value
+        current = current.get(key, _MISSING)
+        if current is _MISSING:
+            return default_value
+
+    return current
+
+@functools.lru_cache(maxsize=256)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """拆分嵌套配置路径"""
+    return tuple(path.split("."))
+
+class _ConfigGetters:
+    """扁平配置的类型化读取，已构建Cython扩展时替换为 _confighelper.ConfigGetters"""
+
+    _config: Dict[str, Any]
+
     def get_string(self, key: str, default_value: str = "") -> str:
         """获取字符串配置"""
-        if key in self.config:
-            value = self.config[key]
-            if isinstance(value, str):
-                return value
+        value = self._config.get(key)
+        if type(value) is str:
+            return value
         return default_value
-    
+
     def get_int(self, key: str, default_value: int = 0) -> int:
         """获取整数配置"""
-        if key in self.config:
-            value = self.config[key]
-            if isinstance(value, int):
-                return value
-            elif isinstance(value, float):
-                return int(value)
-            elif isinstance(value, str):
-                try:
-                    return int(value)
-                except ValueError:
-                    pass
-        return default_value
-    
+        # 先判断精确类型，常见情况只需一次比较；缺失与值为None等价，直接返回默认值
+        value = self._config.get(key)
+        if type(value) is int:
+            return value
+        if value is None:
+            return default_value
+        return _to_int(value, default_value)
+
     def get_float(self, key: str, default_value: float = 0.0) -> float:
         """获取浮点数配置"""
-        if key in self.config:
-            value = self.config[key]
-            if isinstance(value, float):
-                return value
-            elif isinstance(value, int):
-                return float(value)
-            elif isinstance(value, str):
-                try:
-                    return float(value)
-                except ValueError:
-                    pass
-        return default_value
-    
+        value = self._config.get(key)
+        if type(value) is float:
+            return value
+        if value is None:
+            return default_value
+        return _to_float(value, default_value)
+
     def get_bool(self, key: str, default_value: bool = False) -> bool:
         """获取布尔值配置"""
-        if key in self.config:
-            value = self.config[key]
-            if isinstance(value, bool):
-                return value
-            elif isinstance(value, str):
-                return value.lower() in ("true", "yes", "1", "on")
-            elif isinstance(value, int):
-                return value != 0
-        return default_value
-    
+        value = self._config.get(key)
+        if type(value) is bool:
+            return value
+        if value is None:
+            return default_value
+        return _to_bool(value, default_value)
+
     def get_list(self, key: str, default_value: Optional[List[Any]] = None) -> List[Any]:
         """获取列表配置"""
         if default_value is None:
             default_value = []
-        
-        if key in self.config:
-            value = self.config[key]
-            if isinstance(value, list):
-                return value
-        return default_value
-    
+
+        value = self._config.get(key)
+        if value is None:
+            return default_value
+        return _to_list(value, default_value)
+
+    def get_dict(self, key: str, default_value: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """获取字典配置"""
+        if default_value is None:
+            default_value = {}
+
+        value = self._config.get(key)
+        if value is None:
+            return default_value
+        return _to_dict(value, default_value)
+
+# 保留纯Python实现，供与Cython扩展的一致性测试使用
+_PyConfigGetters, _py_lookup_path = _ConfigGetters, _lookup_path
+
+# 已构建Cython扩展时使用其实现，见 _confighelper.pyx
+try:
+    from ._confighelper import ConfigGetters as _ConfigGetters, lookup_path as _lookup_path
+except ImportError:
+    pass
+
+class ConfigHelper(_ConfigGetters):
+    """配置辅助类
+
+    嵌套路径的查找结果按路径缓存，替换 config 时缓存失效；
+    配置字典在创建后应视为只读，原地修改不会反映到已缓存的路径上。
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """初始化配置辅助类"""
+        self.config = config
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """配置字典"""
+        return self._config
+
+    @config.setter
+    def config(self, config: Dict[str, Any]):
+        self._config = config
+        self._cache: Dict[str, Any] = {}
+
+    def _resolve(self, path: str) -> Any:
+        """查找嵌套路径，结果（包括未找到）按路径缓存"""
+        try:
+            return self._cache[path]
+        except KeyError:
+            pass
+        value = _lookup_path(self._config, _split_path(path), _MISSING)
+        self._cache[path] = value
+        return value
+
     def get_string_list(self, key: str, default_value: Optional[List[str]] = None) -> List[str]:
         """获取字符串列表配置"""
         if default_value is None:
             default_value = []
-        
+
         value_list = self.get_list(key, [])
         result = []
-        
+
         for item in value_list:
             if isinstance(item, str):
                 result.append(item)
-        
+
         if not result and default_value:
             return default_value
-        
+
         return result
-    
-    def get_dict(self, key: str, default_value: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """获取字典配置"""
-        if default_value is None:
-            default_value = {}
-        
-        if key in self.config:
-            value = self.config[key]
-            if isinstance(value, dict):
-                return value
-        return default_value
-    
+
     def get_nested(self, path: str, default_value: Any = None) -> Any:
         """获取嵌套配置"""
-        keys = path.split(".")
-        current = self.config
-        
-        for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                return default_value
-        
-        return current
-    
+        value = self._resolve(path)
+        if value is _MISSING:
+            return default_value
+        return value
+
     def get_nested_string(self, path: str, default_value: str = "") -> str:
         """获取嵌套字符串配置"""
-        value = self.get_nested(path)
-        if isinstance(value, str):
+        value = self._resolve(path)
+        if type(value) is str:
             return value
         return default_value
-    
+
     def get_nested_int(self, path: str, default_value: int = 0) -> int:
         """获取嵌套整数配置"""
-        value = self.get_nested(path)
-        if isinstance(value, int):
+        value = self._resolve(path)
+        if type(value) is int:
             return value
-        elif isinstance(value, float):
-            return int(value)
-        elif isinstance(value, str):
-            try:
-                return int(value)
-            except ValueError:
-                pass
-        return default_value
-    
+        if value is _MISSING:
+            return default_value
+        return _to_int(value, default_value)
+
     def get_nested_bool(self, path: str, default_value: bool = False) -> bool:
         """获取嵌套布尔值配置"""
-        value = self.get_nested(path)
-        if isinstance(value, bool):
+        value = self._resolve(path)
+        if type(value) is bool:
             return value
-        elif isinstance(value, str):
-            return value.lower() in ("true", "yes", "1", "on")
-        elif isinstance(value, int):
-            return value != 0
-        return default_value
-    
+        if value is _MISSING:
+            return default_value
+        return _to_bool(value, default_value)
+
     def get_nested_dict(self, path: str, default_value: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """获取嵌套字典配置"""
         if default_value is None:
             default_value = {}
-        
-        value = self.get_nested(path)
-        if isinstance(value, dict):
-            return value
-        return default_value
-    
+
+        value = self._resolve(path)
+        if value is _MISSING:
+            return default_value
+        return _to_dict(value, default_value)
+
     def get_nested_list(self, path: str, default_value: Optional[List[Any]] = None) -> List[Any]:
         """获取嵌套列表配置"""
         if default_value is None:
             default_value = []
-        
-        value = self.get_nested(path)
-        if isinstance(value, list):
-            return value
-        return default_value
+
+        value = self._resolve(path)
+        if value is _MISSING:
+            return default_value
+        return _to_list(value, default_value)
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import bisect
+import copy
 import logging
 import sys
 import os
@@ -17,6 +19,45 @@ class LogLevel(Enum):
     ERROR = 40
     OFF = 100
 
+# 级别名称 -> 日志级别
+_LEVEL_MAP = {
+    "trace": LogLevel.TRACE,
+    "debug": LogLevel.DEBUG,
+    "info": LogLevel.INFO,
+    "warn": LogLevel.WARN,
+    "error": LogLevel.ERROR,
+    "off": LogLevel.OFF
+}
+
+# 级别数值 -> 日志级别，避免 LogLevel(value) 的枚举反查开销
+_LEVEL_BY_INT = {lv.value: lv for lv in LogLevel}
+_SORTED_LEVELS = sorted(LogLevel, key=lambda lv: lv.value)
+_SORTED_VALUES = [lv.value for lv in _SORTED_LEVELS]
+
+def _to_log_level(value: int) -> LogLevel:
+    """将logging级别数值转换为日志级别，无对应值时取不低于它的最近级别"""
+    level = _LEVEL_BY_INT.get(value)
+    if level is None:
+        index = bisect.bisect_left(_SORTED_VALUES, value)
+        level = _SORTED_LEVELS[index] if index < len(_SORTED_LEVELS) else LogLevel.OFF
+    return level
+
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# 添加TRACE级别
+logging.addLevelName(LogLevel.TRACE.value, "TRACE")
+
+_configured = False
+
+def _configure_root():
+    """为根日志记录器配置共享的控制台处理器，只执行一次"""
+    global _configured
+    if _configured:
+        return
+    # 根日志记录器已有处理器时 basicConfig 不做任何修改
+    logging.basicConfig(format=_LOG_FORMAT, level=logging.INFO)
+    _configured = True
+
 class Logger:
     """日志记录器"""
     
@@ -24,75 +65,113 @@ class Logger:
         """初始化日志记录器"""
         self.name = name
         self.logger = logging.getLogger(name)
+        self._fields: Optional[Dict[str, Any]] = None
+        self._children: Dict[str, 'Logger'] = {}
         self.logger.setLevel(level.value)
         
-        # 添加控制台处理器
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
+        # 日志通过传播交给根日志记录器上的共享处理器输出
+        _configure_root()
         
-        # 添加TRACE级别
-        logging.addLevelName(LogLevel.TRACE.value, "TRACE")
+        self._refresh_enabled()
+    
+    def _refresh_enabled(self):
+        """缓存各级别是否启用，供日志方法快速判断
+
+        级别保存在共享的底层logger上，可能被同名的其他记录器修改，
+        因此同时记录缓存时的级别，日志方法发现级别变化时重新计算。
+        """
+        self._cached_level = self.logger.level
+        is_enabled = self.logger.isEnabledFor
+        self._trace_enabled = is_enabled(LogLevel.TRACE.value)
+        self._debug_enabled = is_enabled(LogLevel.DEBUG.value)
+        self._info_enabled = is_enabled(LogLevel.INFO.value)
+        self._warn_enabled = is_enabled(LogLevel.WARN.value)
+        self._error_enabled = is_enabled(LogLevel.ERROR.value)
     
     def trace(self, msg: str, **kwargs):
         """记录跟踪级别日志"""
-        self._log(LogLevel.TRACE.value, msg, kwargs)
+        if self.logger.level != self._cached_level:
+            self._refresh_enabled()
+        if self._trace_enabled:
+            self._log(LogLevel.TRACE.value, msg, kwargs)
     
     def debug(self, msg: str, **kwargs):
         """记录调试级别日志"""
-        self._log(LogLevel.DEBUG.value, msg, kwargs)
+        if self.logger.level != self._cached_level:
+            self._refresh_enabled()
+        if self._debug_enabled:
+            self._log(LogLevel.DEBUG.value, msg, kwargs)
     
     def info(self, msg: str, **kwargs):
         """记录信息级别日志"""
-        self._log(LogLevel.INFO.value, msg, kwargs)
+        if self.logger.level != self._cached_level:
+            self._refresh_enabled()
+        if self._info_enabled:
+            self._log(LogLevel.INFO.value, msg, kwargs)
     
     def warn(self, msg: str, **kwargs):
         """记录警告级别日志"""
-        self._log(LogLevel.WARN.value, msg, kwargs)
+        if self.logger.level != self._cached_level:
+            self._refresh_enabled()
+        if self._warn_enabled:
+            self._log(LogLevel.WARN.value, msg, kwargs)
     
     def error(self, msg: str, **kwargs):
         """记录错误级别日志"""
-        self._log(LogLevel.ERROR.value, msg, kwargs)
+        if self.logger.level != self._cached_level:
+            self._refresh_enabled()
+        if self._error_enabled:
+            self._log(LogLevel.ERROR.value, msg, kwargs)
     
     def _log(self, level: int, msg: str, kwargs: Dict[str, Any]):
         """记录日志"""
-        if not self.logger.isEnabledFor(level):
+        # 缓存的级别标志无法感知 logging.disable 等全局设置，此处再确认一次；
+        # 仅在已启用的路径上执行，标准库会缓存结果
+        logger = self.logger
+        if not logger.isEnabledFor(level):
             return
         
         # 格式化关键字参数
         if kwargs:
-            args_str = " ".join([f"{k}={repr(v)}" for k, v in kwargs.items()])
+            args_str = " ".join(f"{k}={v!r}" for k, v in kwargs.items())
             msg = f"{msg} {args_str}"
         
-        self.logger.log(level, msg)
+        # 直接构造日志记录，跳过 Logger.log 中 findCaller 的调用栈遍历
+        record = logger.makeRecord(
+            logger.name, level, "(unknown file)", 0, msg, None, None
+        )
+        # 附加字段直接写入日志记录的属性；不使用extra，
+        # 否则与 LogRecord 内置属性同名的字段（如module）会引发KeyError
+        if self._fields:
+            record.__dict__.update(self._fields)
+        logger.handle(record)
     
     def with_fields(self, **kwargs) -> 'Logger':
         """返回带有附加字段的新日志记录器"""
-        new_logger = Logger(self.name, LogLevel(self.logger.level))
-        new_logger.logger = self.logger
-        
-        # 使用过滤器添加字段
-        class FieldFilter(logging.Filter):
-            def filter(self, record):
-                for k, v in kwargs.items():
-                    setattr(record, k, v)
-                return True
-        
-        new_logger.logger.addFilter(FieldFilter())
+        # 浅拷贝共享底层logger，不新增处理器也不修改其过滤器
+        new_logger = copy.copy(self)
+        new_logger._fields = {**self._fields, **kwargs} if self._fields else kwargs
         return new_logger
     
     def named(self, name: str) -> 'Logger':
-        """返回带有名称的新日志记录器"""
-        return Logger(f"{self.name}.{name}", LogLevel(self.logger.level))
+        """返回带有名称的子日志记录器，同名子记录器只创建一次，级别与当前记录器同步"""
+        level = self.get_level()
+        child = self._children.get(name)
+        if child is None:
+            child = Logger(f"{self.name}.{name}", level)
+            self._children[name] = child
+        elif child.get_level() is not level:
+            child.set_level(level)
+        return child
     
     def get_level(self) -> LogLevel:
         """获取日志级别"""
-        return LogLevel(self.logger.level)
+        return _to_log_level(self.logger.getEffectiveLevel())
     
     def set_level(self, level: LogLevel):
         """设置日志级别"""
         self.logger.setLevel(level.value)
+        self._refresh_enabled()
     
     def set_output(self, output_file: str):
         """设置日志输出文件"""
@@ -100,27 +179,13 @@ class Logger:
         for handler in self.logger.handlers[:]:
             self.logger.removeHandler(handler)
         
-        # 添加文件处理器
+        # 添加文件处理器，并停止向根日志记录器传播
         handler = logging.FileHandler(output_file)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        formatter = logging.Formatter(_LOG_FORMAT)
         handler.setFormatter(formatter)
         self.logger.addHandler(handler)
+        self.logger.propagate = False
 
 def create_logger(name: str, level: str = "info") -> Logger:
     """创建日志记录器"""
-    log_level = LogLevel.INFO
-    
-    if level.lower() == "trace":
-        log_level = LogLevel.TRACE
-    elif level.lower() == "debug":
-        log_level = LogLevel.DEBUG
-    elif level.lower() == "info":
-        log_level = LogLevel.INFO
-    elif level.lower() == "warn":
-        log_level = LogLevel.WARN
-    elif level.lower() == "error":
-        log_level = LogLevel.ERROR
-    elif level.lower() == "off":
-        log_level = LogLevel.OFF
-    
-    return Logger(name, log_level)
+    return Logger(name, _LEVEL_MAP.get(level.lower(), LogLevel.INFO))
@@ -2,11 +2,13 @@
 # -*- coding: utf-8 -*-
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Union
 import time
 import json
 import sys
 import os
+import selectors
 import signal
 import traceback
 
@@ -14,24 +16,86 @@ import traceback
 from .logger import create_logger, Logger, LogLevel
 from .config import ConfigHelper
 
+# 优先使用orjson（原生扩展，直接输出bytes），未安装时回退到标准库json
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+
+# from_dict 接受的字段
+_REQUEST_FIELDS = ("id", "action", "params", "metadata", "timeout")
+_EVENT_FIELDS = ("id", "type", "source", "data", "metadata", "timestamp")
+
+def _now_ms() -> int:
+    """当前时间的毫秒时间戳"""
+    return time.time_ns() // 1_000_000
+
+def _intern(value: Any) -> Any:
+    """驻留字符串，使处理器中与字面量的比较可走指针相等的快速路径"""
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+# 错误码 -> 错误响应中位于id与message之间的固定片段
+_ERROR_RESPONSE_HEADS: Dict[str, bytes] = {}
+
+def encode_error_response(request_id: str, code: str, message: str) -> bytes:
+    """编码失败响应，结果可直接作为 handle_request 的返回值发送
+
+    与 Response(success=False, error=...) 序列化结果一致，但固定部分按错误码
+    预先编码，只需拼接id与message。
+    """
+    head = _ERROR_RESPONSE_HEADS.get(code)
+    if head is None:
+        head = (b',"success":false,"data":{},"metadata":{},"error":{"code":'
+                + _dumps(code) + b',"message":')
+        _ERROR_RESPONSE_HEADS[code] = head
+    return b'{"id":' + _dumps(request_id) + head + _dumps(message) + b'}}'
+
+def error_response(request_id: str, code: str, message: str) -> 'Response':
+    """创建失败响应对象，需要 Response 对象形式时使用，与 encode_error_response 内容一致"""
+    return Response(
+        id=request_id,
+        success=False,
+        error={
+            "code": code,
+            "message": message
+        }
+    )
+
+@dataclass(frozen=True, slots=True)
 class ModuleInfo:
     """模块信息类"""
-    def __init__(self, id: str, name: str, version: str, description: str = "",
-                 author: str = "", license: str = "", capabilities: List[str] = None,
-                 supported_platforms: List[str] = None):
-        self.id = id
-        self.name = name
-        self.version = version
-        self.description = description
-        self.author = author
-        self.license = license
-        self.capabilities = capabilities or []
-        self.supported_platforms = supported_platforms or []
-        self.language = "python"
+    id: str
+    name: str
+    version: str
+    description: str = ""
+    author: str = ""
+    license: str = ""
+    capabilities: List[str] = field(default_factory=list)
+    supported_platforms: List[str] = field(default_factory=list)
+    language: str = field(default="python", init=False)
+    _dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.capabilities is None:
+            object.__setattr__(self, "capabilities", [])
+        if self.supported_platforms is None:
+            object.__setattr__(self, "supported_platforms", [])
 
     def to_dict(self) -> Dict[str, Any]:
-        """转换为字典"""
-        return {
+        """转换为字典，字段不可变，结果在首次调用后缓存"""
+        if self._dict is not None:
+            return self._dict
+        result = {
             "id": self.id,
             "name": self.name,
             "version": self.version,
@@ -42,37 +106,46 @@ class ModuleInfo:
             "supported_platforms": self.supported_platforms,
             "language": self.language
         }
+        object.__setattr__(self, "_dict", result)
+        return result
 
+@dataclass(slots=True)
 class Request:
     """请求类"""
-    def __init__(self, id: str, action: str, params: Dict[str, Any] = None,
-                 metadata: Dict[str, str] = None, timeout: int = 30000):
-        self.id = id
-        self.action = action
-        self.params = params or {}
-        self.metadata = metadata or {}
-        self.timeout = timeout
+    id: str = ""
+    action: str = ""
+    params: Dict[str, Any] = field(default_factory=dict)
+    metadata: Dict[str, str] = field(default_factory=dict)
+    timeout: int = 30000
+
+    def __post_init__(self):
+        if self.params is None:
+            self.params = {}
+        if self.metadata is None:
+            self.metadata = {}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Request':
         """从字典创建请求"""
-        return cls(
-            id=data.get("id", ""),
-            action=data.get("action", ""),
-            params=data.get("params", {}),
-            metadata=data.get("metadata", {}),
-            timeout=data.get("timeout", 30000)
-        )
+        kwargs = {k: data[k] for k in _REQUEST_FIELDS if k in data}
+        if "action" in kwargs:
+            kwargs["action"] = _intern(kwargs["action"])
+        return cls(**kwargs)
 
+@dataclass(slots=True)
 class Response:
     """响应类"""
-    def __init__(self, id: str, success: bool = True, data: Dict[str, Any] = None,
-                 error: Dict[str, Any] = None, metadata: Dict[str, str] = None):
-        self.id = id
-        self.success = success
-        self.data = data or {}
-        self.error = error
-        self.metadata = metadata or {}
+    id: str = ""
+    success: bool = True
+    data: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[Dict[str, Any]] = None
+    metadata: Dict[str, str] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if self.data is None:
+            self.data = {}
+        if self.metadata is None:
+            self.metadata = {}
 
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
@@ -86,28 +159,33 @@ class Response:
             result["error"] = self.error
         return result
 
+@dataclass(slots=True)
 class Event:
     """事件类"""
-    def __init__(self, id: str, type: str, source: str, data: Dict[str, Any] = None,
-                 metadata: Dict[str, str] = None, timestamp: int = None):
-        self.id = id
-        self.type = type
-        self.source = source
-        self.data = data or {}
-        self.metadata = metadata or {}
-        self.timestamp = timestamp or int(time.time() * 1000)
+    id: str = ""
+    type: str = ""
+    source: str = ""
+    data: Dict[str, Any] = field(default_factory=dict)
+    metadata: Dict[str, str] = field(default_factory=dict)
+    timestamp: Optional[int] = None
+
+    def __post_init__(self):
+        if self.data is None:
+            self.data = {}
+        if self.metadata is None:
+            self.metadata = {}
+        if not self.timestamp:
+            self.timestamp = _now_ms()
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Event':
         """从字典创建事件"""
-        return cls(
-            id=data.get("id", ""),
-            type=data.get("type", ""),
-            source=data.get("source", ""),
-            data=data.get("data", {}),
-            metadata=data.get("metadata", {}),
-            timestamp=data.get("timestamp", int(time.time() * 1000))
-        )
+        kwargs = {k: data[k] for k in _EVENT_FIELDS if k in data}
+        if "type" in kwargs:
+            kwargs["type"] = _intern(kwargs["type"])
+        if "source" in kwargs:
+            kwargs["source"] = _intern(kwargs["source"])
+        return cls(**kwargs)
 
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
@@ -120,13 +198,18 @@ class Event:
             "timestamp": self.timestamp
         }
 
+@dataclass(slots=True)
 class HealthStatus:
     """健康状态类"""
-    def __init__(self, status: str = "healthy", details: Dict[str, Any] = None,
-                 timestamp: int = None):
-        self.status = status
-        self.details = details or {}
-        self.timestamp = timestamp or int(time.time() * 1000)
+    status: str = "healthy"
+    details: Dict[str, Any] = field(default_factory=dict)
+    timestamp: Optional[int] = None
+
+    def __post_init__(self):
+        if self.details is None:
+            self.details = {}
+        if not self.timestamp:
+            self.timestamp = _now_ms()
 
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
@@ -137,7 +220,16 @@ class HealthStatus:
         }
 
 class Module(ABC):
-    """模块基类"""
+    """模块基类
+
+    init/start/stop 完成公共的状态设置后分别调用 _on_init/_on_start/_on_stop，
+    子类可实现这些钩子（默认为空操作），也可以直接重写 init/start/stop。
+    """
+
+    __slots__ = ("logger", "config", "config_helper", "start_time", "_start_mono")
+
+    # on_tick 的调用间隔（秒），为None时不启用周期回调
+    tick_interval: Optional[float] = None
 
     def __init__(self):
         """初始化模块"""
@@ -145,21 +237,34 @@ class Module(ABC):
         self.config = {}
         self.config_helper = ConfigHelper({})
         self.start_time = time.time()
+        self._start_mono = time.monotonic()
 
-    @abstractmethod
     def init(self, config: Dict[str, Any]) -> None:
         """初始化模块"""
         self.config = config
         self.config_helper = ConfigHelper(config)
+        self._on_init(config)
 
-    @abstractmethod
     def start(self) -> None:
         """启动模块"""
         self.start_time = time.time()
+        self._start_mono = time.monotonic()
+        self._on_start()
 
-    @abstractmethod
     def stop(self) -> None:
         """停止模块"""
+        self._on_stop()
+
+    def _on_init(self, config: Dict[str, Any]) -> None:
+        """模块初始化钩子"""
+        pass
+
+    def _on_start(self) -> None:
+        """模块启动钩子"""
+        pass
+
+    def _on_stop(self) -> None:
+        """模块停止钩子"""
         pass
 
     @abstractmethod
@@ -168,8 +273,8 @@ class Module(ABC):
         pass
 
     @abstractmethod
-    def handle_request(self, request: Request) -> Response:
-        """处理请求"""
+    def handle_request(self, request: Request) -> Union[Response, bytes]:
+        """处理请求，也可返回 encode_error_response 生成的预编码响应"""
         pass
 
     @abstractmethod
@@ -182,14 +287,23 @@ class Module(ABC):
         return HealthStatus(
             status="healthy",
             details={
-                "uptime": time.time() - self.start_time
+                "uptime": time.monotonic() - self._start_mono
             },
-            timestamp=int(time.time() * 1000)
+            timestamp=_now_ms()
         )
 
+    def on_tick(self) -> None:
+        """周期回调，在命令处理循环空闲时按 tick_interval 调用"""
+        pass
+
 class BaseModule(Module):
     """基础模块实现"""
 
+    __slots__ = (
+        "id", "name", "version", "description", "author", "license",
+        "capabilities", "supported_platforms", "_info"
+    )
+
     def __init__(self, id: str, name: str, version: str, description: str = ""):
         """初始化基础模块"""
         super().__init__()
@@ -201,46 +315,52 @@ class BaseModule(Module):
         self.license = ""
         self.capabilities = []
         self.supported_platforms = ["windows", "linux", "darwin"]
+        self._info = None
 
-    def init(self, config: Dict[str, Any]) -> None:
+    def _on_init(self, config: Dict[str, Any]) -> None:
         """初始化模块"""
-        super().init(config)
         self.logger.info("初始化模块", id=self.id)
 
-    def start(self) -> None:
+    def _on_start(self) -> None:
         """启动模块"""
-        super().start()
         self.logger.info("启动模块", id=self.id)
 
-    def stop(self) -> None:
+    def _on_stop(self) -> None:
         """停止模块"""
         self.logger.info("停止模块", id=self.id)
-        uptime = time.time() - self.start_time
+        uptime = time.monotonic() - self._start_mono
         self.logger.info("运行时间", uptime=f"{uptime:.2f}秒")
 
     def get_info(self) -> ModuleInfo:
-        """获取模块信息"""
-        return ModuleInfo(
-            id=self.id,
-            name=self.name,
-            version=self.version,
-            description=self.description,
-            author=self.author,
-            license=self.license,
-            capabilities=self.capabilities,
-            supported_platforms=self.supported_platforms
+        """获取模块信息，初始化完成后模块信息不再变化，首次调用后缓存"""
+        if self._info is None:
+            self._info = ModuleInfo(
+                id=self.id,
+                name=self.name,
+                version=self.version,
+                description=self.description,
+                author=self.author,
+                license=self.license,
+                capabilities=self.capabilities,
+                supported_platforms=self.supported_platforms
+            )
+        return self._info
+
+    def handle_request(self, request: Request) -> Union[Response, bytes]:
+        """处理请求
+
+        默认返回预编码的 not_implemented 响应（bytes）；子类需要对象形式时
+        使用 not_implemented_response。
+        """
+        self.logger.info("处理请求", action=request.action)
+        return encode_error_response(
+            request.id, "not_implemented", f"未实现的操作: {request.action}"
         )
 
-    def handle_request(self, request: Request) -> Response:
-        """处理请求"""
-        self.logger.info("处理请求", action=request.action)
-        return Response(
-            id=request.id,
-            success=False,
-            error={
-                "code": "not_implemented",
-                "message": f"未实现的操作: {request.action}"
-            }
+    def not_implemented_response(self, request: Request) -> Response:
+        """创建 not_implemented 失败响应对象"""
+        return error_response(
+            request.id, "not_implemented", f"未实现的操作: {request.action}"
         )
 
     def handle_event(self, event: Event) -> bool:
@@ -248,6 +368,9 @@ class BaseModule(Module):
         self.logger.info("处理事件", type=event.type, source=event.source)
         return False
 
+# 标准输入单次读取的最大字节数
+_READ_CHUNK_SIZE = 65536
+
 class ModuleRunner:
     """模块运行器"""
 
@@ -255,6 +378,21 @@ class ModuleRunner:
         """初始化运行器"""
         self.module = module
         self.logger = create_logger("ModuleRunner", "info")
+        self._buf = bytearray()
+        self._running = False
+        # 输出写入二进制缓冲区，在回到读取前统一刷新
+        self._write = sys.stdout.buffer.write
+        # 行标签 -> 处理函数
+        self._line_handlers = {
+            b"KENNEL_COMMAND": self._on_command_line,
+            b"KENNEL_STOP": self._on_stop_line
+        }
+        # 命令类型 -> 处理函数
+        self._command_handlers = {
+            "request": self._do_request,
+            "event": self._do_event,
+            "health_check": self._do_health
+        }
 
     def run(self):
         """运行模块"""
@@ -270,7 +408,7 @@ class ModuleRunner:
 
         try:
             # 解析配置
-            config = json.loads(config_json)
+            config = _loads(config_json)
 
             # 初始化模块
             self.logger.info("初始化模块")
@@ -286,7 +424,7 @@ class ModuleRunner:
                 "plugin_id": plugin_id,
                 "info": self.module.get_info().to_dict()
             }
-            print(f"KENNEL_PLUGIN_READY:{json.dumps(ready_info)}")
+            self._send(b"KENNEL_PLUGIN_READY", ready_info)
             sys.stdout.flush()
 
             # 进入命令处理循环
@@ -300,7 +438,7 @@ class ModuleRunner:
                 "plugin_id": plugin_id,
                 "error": str(e)
             }
-            print(f"KENNEL_PLUGIN_ERROR:{json.dumps(error_info)}")
+            self._send(b"KENNEL_PLUGIN_ERROR", error_info)
             sys.stdout.flush()
             sys.exit(1)
 
@@ -317,26 +455,49 @@ class ModuleRunner:
         """命令处理循环"""
         self.logger.info("进入命令处理循环")
 
+        fd = sys.stdin.fileno()
+        buf = self._buf
+        # 经文本层刷新，先写出 print() 等暂存在文本层的内容，再刷新二进制缓冲区
+        flush = sys.stdout.flush
+        tick_interval = self.module.tick_interval
+        selector = self._create_selector(fd) if tick_interval else None
+        next_tick = time.monotonic() + tick_interval if selector is not None else 0.0
+        self._running = True
+
         try:
-            while True:
-                # 读取命令
-                line = sys.stdin.readline().strip()
-                if not line:
-                    continue
-
-                # 解析命令
-                if line.startswith("KENNEL_COMMAND:"):
-                    command_json = line[len("KENNEL_COMMAND:"):]
-                    self.handle_command(command_json)
-                elif line == "KENNEL_STOP":
-                    self.logger.info("收到停止命令")
+            while self._running:
+                # 阻塞读取前一次性刷新本批次的所有响应
+                flush()
+
+                # 启用周期回调时，等待输入可读或到达下一次回调时间
+                if selector is not None:
+                    readable = selector.select(next_tick - time.monotonic())
+                    if time.monotonic() >= next_tick:
+                        next_tick = time.monotonic() + tick_interval
+                        self._tick()
+                    if not readable:
+                        continue
+
+                # 按块读取标准输入，避免逐行读取的开销
+                chunk = os.read(fd, _READ_CHUNK_SIZE)
+                if not chunk:
+                    self.logger.info("标准输入已关闭")
                     break
+                buf.extend(chunk)
+                self._drain_lines()
         except KeyboardInterrupt:
             self.logger.info("收到中断信号")
         except Exception as e:
             self.logger.error(f"命令处理错误: {e}")
             self.logger.error(traceback.format_exc())
         finally:
+            self._running = False
+            if selector is not None:
+                selector.close()
+            try:
+                flush()
+            except Exception:
+                pass
             # 停止模块
             self.logger.info("停止模块")
             try:
@@ -345,42 +506,111 @@ class ModuleRunner:
                 self.logger.error(f"停止模块错误: {e}")
                 self.logger.error(traceback.format_exc())
 
-    def handle_command(self, command_json: str):
+    def _create_selector(self, fd: int) -> Optional[selectors.BaseSelector]:
+        """为标准输入创建选择器，平台不支持时返回None"""
+        # Windows 上的 select 只支持套接字，无法等待管道
+        if sys.platform == "win32":
+            self.logger.warn("当前平台不支持等待标准输入，周期回调已禁用")
+            return None
+        selector = selectors.DefaultSelector()
+        try:
+            selector.register(fd, selectors.EVENT_READ)
+        except (OSError, ValueError) as e:
+            selector.close()
+            self.logger.warn(f"无法监听标准输入，周期回调已禁用: {e}")
+            return None
+        return selector
+
+    def _tick(self):
+        """调用模块的周期回调"""
+        try:
+            self.module.on_tick()
+        except Exception as e:
+            self.logger.error(f"周期回调错误: {e}")
+            self.logger.error(traceback.format_exc())
+
+    def _drain_lines(self):
+        """处理缓冲区中所有完整的行"""
+        buf = self._buf
+        start = 0
+        while self._running:
+            end = buf.find(b"\n", start)
+            if end < 0:
+                break
+            line = bytes(buf[start:end]).strip()
+            start = end + 1
+            if not line:
+                continue
+
+            # 按行标签分发，格式为 TAG[:PAYLOAD]
+            tag, _, payload = line.partition(b":")
+            handler = self._line_handlers.get(tag)
+            if handler is not None:
+                handler(payload)
+        del buf[:start]
+
+    def _on_command_line(self, payload: bytes):
+        """处理KENNEL_COMMAND行"""
+        self.handle_command(payload)
+
+    def _on_stop_line(self, payload: bytes):
+        """处理KENNEL_STOP行"""
+        self.logger.info("收到停止命令")
+        self._running = False
+
+    def handle_command(self, command_json: Union[str, bytes]):
         """处理命令"""
         try:
-            command = json.loads(command_json)
+            command = _loads(command_json)
             command_type = command.get("type", "")
-            command_data = command.get("data", {})
-
-            if command_type == "request":
-                # 处理请求
-                request = Request.from_dict(command_data)
-                self.logger.info(f"处理请求: {request.action}")
-                response = self.module.handle_request(request)
-                self.send_response(response)
-            elif command_type == "event":
-                # 处理事件
-                event = Event.from_dict(command_data)
-                self.logger.info(f"处理事件: {event.type}")
-                success = self.module.handle_event(event)
-                self.send_event_response(event.id, success)
-            elif command_type == "health_check":
-                # 健康检查
-                self.logger.info("健康检查")
-                health = self.module.check_health()
-                self.send_health_response(health)
-            else:
-                self.logger.warning(f"未知命令类型: {command_type}")
+            handler = self._command_handlers.get(command_type)
+            if handler is None:
+                self.logger.warn(f"未知命令类型: {command_type}")
+                return
+            handler(command.get("data", {}))
         except Exception as e:
             self.logger.error(f"处理命令错误: {e}")
             self.logger.error(traceback.format_exc())
             self.send_error_response(str(e))
 
-    def send_response(self, response: Response):
+    def _do_request(self, data: Dict[str, Any]):
+        """处理请求命令"""
+        request = Request.from_dict(data)
+        self.logger.info(f"处理请求: {request.action}")
+        response = self.module.handle_request(request)
+        self.send_response(response)
+
+    def _do_event(self, data: Dict[str, Any]):
+        """处理事件命令"""
+        event = Event.from_dict(data)
+        self.logger.info(f"处理事件: {event.type}")
+        success = self.module.handle_event(event)
+        self.send_event_response(event.id, success)
+
+    def _do_health(self, data: Dict[str, Any]):
+        """处理健康检查命令"""
+        self.logger.info("健康检查")
+        health = self.module.check_health()
+        self.send_health_response(health)
+
+    def _send(self, tag: bytes, payload: Dict[str, Any]):
+        """向输出缓冲区写入一条消息，由命令循环负责刷新"""
+        self._send_raw(tag, _dumps(payload))
+
+    def _send_raw(self, tag: bytes, payload: bytes):
+        """向输出缓冲区写入一条已编码的消息"""
+        write = self._write
+        write(tag)
+        write(b":")
+        write(payload)
+        write(b"\n")
+
+    def send_response(self, response: Union[Response, bytes]):
         """发送响应"""
-        response_json = json.dumps(response.to_dict())
-        print(f"KENNEL_RESPONSE:{response_json}")
-        sys.stdout.flush()
+        if type(response) is bytes:
+            self._send_raw(b"KENNEL_RESPONSE", response)
+        else:
+            self._send(b"KENNEL_RESPONSE", response.to_dict())
 
     def send_event_response(self, event_id: str, success: bool):
         """发送事件响应"""
@@ -388,25 +618,18 @@ class ModuleRunner:
             "event_id": event_id,
             "success": success
         }
-        response_json = json.dumps(response)
-        print(f"KENNEL_EVENT_RESPONSE:{response_json}")
-        sys.stdout.flush()
+        self._send(b"KENNEL_EVENT_RESPONSE", response)
 
     def send_health_response(self, health: HealthStatus):
         """发送健康响应"""
-        response = health.to_dict()
-        response_json = json.dumps(response)
-        print(f"KENNEL_HEALTH_RESPONSE:{response_json}")
-        sys.stdout.flush()
+        self._send(b"KENNEL_HEALTH_RESPONSE", health.to_dict())
 
     def send_error_response(self, error: str):
         """发送错误响应"""
         response = {
             "error": error
         }
-        response_json = json.dumps(response)
-        print(f"KENNEL_ERROR:{response_json}")
-        sys.stdout.flush()
+        self._send(b"KENNEL_ERROR", response)
 
 def run_module(module: Module):
     """运行模块"""
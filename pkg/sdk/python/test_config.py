@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from . import config
+from .config import ConfigHelper
+
+try:
+    from . import _confighelper
+except ImportError:
+    _confighelper = None
+
+# 覆盖各转换分支的配置值
+_VALUES = [
+    None, True, False, 0, 1, 7, -3, 2.5, 0.0, "", "x", "12", "2.5", "true", "Yes",
+    "ON", "0", "off", [], [1, "a"], {}, {"a": 1}, (1,), object()
+]
+
+_GETTERS = ["get_string", "get_int", "get_float", "get_bool", "get_list", "get_dict"]
+
+_CONFIG = {
+    "s": "x",
+    "i": 3,
+    "b": True,
+    "n": None,
+    "d": {"a": {"b": "7", "c": None, "t": "true"}, "l": [1]},
+}
+
+_PATHS = [
+    (), ("s",), ("missing",), ("d",), ("d", "a"), ("d", "a", "b"), ("d", "a", "c"),
+    ("d", "a", "b", "z"), ("d", "x"), ("s", "x"), ("d", "l", "0"),
+]
+
+_DEFAULT = object()
+
+def _getters(cls, values):
+    """创建读取 values 的实例"""
+    getters = cls()
+    getters._config = values
+    return getters
+
+class ConfigHelperTest(unittest.TestCase):
+    """配置辅助类测试"""
+
+    def test_getters(self):
+        helper = ConfigHelper(_CONFIG)
+        self.assertEqual(helper.get_string("s"), "x")
+        self.assertEqual(helper.get_string("i", "d"), "d")
+        self.assertEqual(helper.get_int("i"), 3)
+        self.assertIs(type(helper.get_int("b")), int)
+        self.assertEqual(helper.get_bool("missing", True), True)
+        self.assertEqual(helper.get_nested_int("d.a.b"), 7)
+        self.assertTrue(helper.get_nested_bool("d.a.t"))
+        self.assertIsNone(helper.get_nested("d.a.c", "d"))
+        self.assertEqual(helper.get_nested("d.x", "d"), "d")
+
+    def test_unhashable_key(self):
+        helper = ConfigHelper(_CONFIG)
+        for name in _GETTERS:
+            with self.subTest(getter=name):
+                with self.assertRaises(TypeError):
+                    getattr(helper, name)(["x"], _DEFAULT)
+
+    def test_nested_cache_reset_on_config_replace(self):
+        helper = ConfigHelper({"a": {"b": 1}})
+        self.assertEqual(helper.get_nested("a.b"), 1)
+        helper.config = {"a": {"b": 2}}
+        self.assertEqual(helper.get_nested("a.b"), 2)
+
+@unittest.skipIf(_confighelper is None, "Cython扩展未构建")
+class CythonParityTest(unittest.TestCase):
+    """Cython扩展与纯Python实现的一致性测试"""
+
+    def test_getters(self):
+        for name in _GETTERS:
+            for values in [{"k": value} for value in _VALUES] + [{}]:
+                with self.subTest(getter=name, values=values):
+                    expected = getattr(_getters(config._PyConfigGetters, values), name)("k", _DEFAULT)
+                    actual = getattr(_getters(_confighelper.ConfigGetters, values), name)("k", _DEFAULT)
+                    self.assertEqual(type(actual), type(expected))
+                    self.assertEqual(actual, expected)
+
+    def test_unhashable_key(self):
+        for cls in (config._PyConfigGetters, _confighelper.ConfigGetters):
+            for name in _GETTERS:
+                with self.subTest(cls=cls, getter=name):
+                    with self.assertRaises(TypeError):
+                        getattr(_getters(cls, _CONFIG), name)(["x"], _DEFAULT)
+        for lookup_path in (config._py_lookup_path, _confighelper.lookup_path):
+            with self.subTest(lookup_path=lookup_path):
+                with self.assertRaises(TypeError):
+                    lookup_path(_CONFIG, (["x"],), _DEFAULT)
+
+    def test_lookup_path(self):
+        for keys in _PATHS:
+            with self.subTest(keys=keys):
+                self.assertIs(
+                    _confighelper.lookup_path(_CONFIG, keys, _DEFAULT),
+                    config._py_lookup_path(_CONFIG, keys, _DEFAULT)
+                )
+
+if __name__ == "__main__":
+    unittest.main()
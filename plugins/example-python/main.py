@@ -7,42 +7,58 @@ import time
 import platform
 import json
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
 
 # 添加SDK路径
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../pkg/sdk/python")))
 
 try:
-    from module import Module, ModuleInfo, Request, Response, Event, run_module
+    from module import Module, ModuleInfo, Request, Response, Event, encode_error_response, run_module
 except ImportError:
     print("无法导入SDK模块，请确保SDK已安装")
     sys.exit(1)
 
+# 进程生命周期内不变的系统信息，导入时采集一次
+_STATIC_SYSINFO = {
+    "platform": platform.platform(),
+    "system": platform.system(),
+    "release": platform.release(),
+    "version": platform.version(),
+    "architecture": platform.architecture(),
+    "machine": platform.machine(),
+    "processor": platform.processor(),
+    "python_version": platform.python_version(),
+    "node": platform.node()
+}
+
 class ExamplePythonPlugin(Module):
     """示例Python插件"""
     
     def __init__(self):
         """初始化插件"""
         super().__init__()
-        self.config = {}
-        self.start_time = time.time()
         self.logger.setLevel(logging.DEBUG)
+        
+        # 操作名称 -> 处理函数
+        self._actions = {
+            "hello": self._do_hello,
+            "get_system_info": self._do_system_info,
+            "echo": self._do_echo
+        }
     
-    def init(self, config: Dict[str, Any]) -> None:
+    def _on_init(self, config: Dict[str, Any]) -> None:
         """初始化模块"""
         self.logger.info("初始化Python示例插件")
-        self.config = config
         self.logger.info(f"配置: {json.dumps(config)}")
     
-    def start(self) -> None:
+    def _on_start(self) -> None:
         """启动模块"""
         self.logger.info("启动Python示例插件")
-        self.start_time = time.time()
     
-    def stop(self) -> None:
+    def _on_stop(self) -> None:
         """停止模块"""
         self.logger.info("停止Python示例插件")
-        uptime = time.time() - self.start_time
+        uptime = time.monotonic() - self._start_mono
         self.logger.info(f"运行时间: {uptime:.2f}秒")
     
     def get_info(self) -> ModuleInfo:
@@ -58,44 +74,46 @@ class ExamplePythonPlugin(Module):
             supported_platforms=["windows", "linux", "darwin"]
         )
     
-    def handle_request(self, request: Request) -> Response:
+    def handle_request(self, request: Request) -> Union[Response, bytes]:
         """处理请求"""
         self.logger.info(f"处理请求: {request.action}")
         
-        if request.action == "hello":
-            return Response(
-                id=request.id,
-                success=True,
-                data={
-                    "message": "Hello from Python!",
-                    "timestamp": time.time()
-                }
-            )
-        elif request.action == "get_system_info":
-            return Response(
-                id=request.id,
-                success=True,
-                data=self._get_system_info()
-            )
-        elif request.action == "echo":
-            message = request.params.get("message", "")
-            return Response(
-                id=request.id,
-                success=True,
-                data={
-                    "message": message,
-                    "timestamp": time.time()
-                }
-            )
-        else:
-            return Response(
-                id=request.id,
-                success=False,
-                error={
-                    "code": "unknown_action",
-                    "message": f"未知操作: {request.action}"
-                }
-            )
+        handler = self._actions.get(request.action)
+        if handler is not None:
+            return handler(request)
+        
+        return encode_error_response(request.id, "unknown_action", f"未知操作: {request.action}")
+    
+    def _do_hello(self, request: Request) -> Response:
+        """处理hello请求"""
+        return Response(
+            id=request.id,
+            success=True,
+            data={
+                "message": "Hello from Python!",
+                "timestamp": time.time()
+            }
+        )
+    
+    def _do_system_info(self, request: Request) -> Response:
+        """处理get_system_info请求"""
+        return Response(
+            id=request.id,
+            success=True,
+            data=self._get_system_info()
+        )
+    
+    def _do_echo(self, request: Request) -> Response:
+        """处理echo请求"""
+        message = request.params.get("message", "")
+        return Response(
+            id=request.id,
+            success=True,
+            data={
+                "message": message,
+                "timestamp": time.time()
+            }
+        )
     
     def handle_event(self, event: Event) -> bool:
         """处理事件"""
@@ -113,18 +131,9 @@ class ExamplePythonPlugin(Module):
     
     def _get_system_info(self) -> Dict[str, Any]:
         """获取系统信息"""
-        return {
-            "platform": platform.platform(),
-            "system": platform.system(),
-            "release": platform.release(),
-            "version": platform.version(),
-            "architecture": platform.architecture(),
-            "machine": platform.machine(),
-            "processor": platform.processor(),
-            "python_version": platform.python_version(),
-            "node": platform.node(),
-            "uptime": time.time() - self.start_time
-        }
+        info = _STATIC_SYSINFO.copy()
+        info["uptime"] = time.monotonic() - self._start_mono
+        return info
 
 if __name__ == "__main__":
     # 创建并运行插件